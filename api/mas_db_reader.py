@@ -20,6 +20,8 @@ class IntermediateMasTable(Database):
 
     def __init__(self, debug=False):
         self.debug = debug
+        self.engine = None
+        self.schema = None
 
     def print_query(self, query):
         print(query.statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
@@ -31,6 +33,15 @@ class IntermediateMasTable(Database):
         return magnetic
 
     def connect(self, schema='public'):
+        if self.engine is not None and self.schema == schema:
+            # Reflecting the database is far more expensive than the queries
+            # themselves, so only the session is recreated on reconnect.
+            self.session = self.Session()
+            return
+
+        if self.engine is not None:
+            self.engine.dispose()
+
         driver = "postgresql"
         address = os.getenv('OM_DB_ADDRESS')
         port = os.getenv('OM_DB_PORT')
@@ -38,16 +49,19 @@ class IntermediateMasTable(Database):
         user = os.getenv('OM_DB_USER')
         password = os.getenv('OM_DB_PASSWORD')
 
-        self.engine = sqlalchemy.create_engine(f"{driver}://{user}:{password}@{address}:{port}/{name}")
+        # The engine outlives individual queries, so check pooled connections
+        # before use in case the server dropped them while idle.
+        self.engine = sqlalchemy.create_engine(f"{driver}://{user}:{password}@{address}:{port}/{name}", pool_pre_ping=True)
 
         metadata = sqlalchemy.MetaData()
         metadata.reflect(self.engine, schema=schema)
         Base = automap_base(metadata=metadata)
         Base.prepare()
 
-        Session = sqlalchemy.orm.sessionmaker(bind=self.engine)
-        self.session = Session()
+        self.Session = sqlalchemy.orm.sessionmaker(bind=self.engine)
+        self.session = self.Session()
         self.Table = Base.classes.intermediate_mas
+        self.schema = schema
 
     def get_mas(self, limit=1):
         self.connect()
@@ -30,6 +30,9 @@ try:
 except ImportError:
     HAS_JSONSCHEMA = False
 
+# Waveform labels accepted by validate_waveform
+_VALID_WAVEFORM_LABELS = ["Sinusoidal", "Triangular", "Rectangular", "Trapezoidal", "Custom"]
+
 
 class SchemaValidationError(Exception):
     """Exception raised when schema validation fails."""
@@ -46,12 +49,12 @@ class SchemaValidationError(Exception):
 def _get_schema_dir() -> Path:
     """Get the path to MAS schema files."""
     # Look for schemas in common locations
-    possible_paths = [
+    possible_paths = (
         Path(__file__).parent.parent / "MAS" / "schemas",
         Path(__file__).parent / "schemas",
         Path.home() / "OpenMagnetics" / "MAS" / "schemas",
         Path("/home/alf/OpenMagnetics/MAS/schemas"),
-    ]
+    )
     
     for path in possible_paths:
         if path.exists() and (path / "inputs.json").exists():
@@ -74,6 +77,24 @@ def _load_schema(schema_name: str) -> Optional[Dict[str, Any]]:
         return json.load(f)
 
 
+# Validators by schema name; misses are not cached so schemas installed later are found
+_VALIDATOR_CACHE: Dict[str, 'Draft7Validator'] = {}
+
+
+def _get_validator(schema_name: str) -> Optional['Draft7Validator']:
+    """Build a validator for a schema once and reuse it across calls."""
+    if schema_name in _VALIDATOR_CACHE:
+        return _VALIDATOR_CACHE[schema_name]
+    
+    schema = _load_schema(schema_name)
+    if not schema:
+        return None
+    
+    validator = Draft7Validator(schema)
+    _VALIDATOR_CACHE[schema_name] = validator
+    return validator
+
+
 def _format_validation_error(error: 'ValidationError') -> str:
     """Format a validation error into a human-readable message."""
     path = " -> ".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
@@ -132,12 +153,11 @@ def validate_inputs(inputs: Dict[str, Any], raise_on_error: bool = False) -> Lis
     if not HAS_JSONSCHEMA:
         return ["jsonschema package not installed. Install with: pip install jsonschema"]
     
-    schema = _load_schema("inputs")
-    if not schema:
+    validator = _get_validator("inputs")
+    if validator is None:
         return ["Could not find MAS schema files. Skipping validation."]
     
     errors = []
-    validator = Draft7Validator(schema)
     
     for error in validator.iter_errors(inputs):
         errors.append(_format_validation_error(error))
@@ -169,12 +189,11 @@ def validate_magnetic(magnetic: Dict[str, Any], raise_on_error: bool = False) ->
     if not HAS_JSONSCHEMA:
         return ["jsonschema package not installed. Install with: pip install jsonschema"]
     
-    schema = _load_schema("magnetic")
-    if not schema:
+    validator = _get_validator("magnetic")
+    if validator is None:
         return ["Could not find MAS schema files. Skipping validation."]
     
     errors = []
-    validator = Draft7Validator(schema)
     
     for error in validator.iter_errors(magnetic):
         errors.append(_format_validation_error(error))
@@ -347,9 +366,8 @@ def validate_waveform(waveform: Dict[str, Any], waveform_type: str = "current")
         if not isinstance(processed, dict):
             errors.append("'processed' must be a dictionary")
         else:
-            valid_labels = ["Sinusoidal", "Triangular", "Rectangular", "Trapezoidal", "Custom"]
-            if "label" in processed and processed["label"] not in valid_labels:
-                errors.append(f"Invalid waveform label: must be one of {valid_labels}")
+            if "label" in processed and processed["label"] not in _VALID_WAVEFORM_LABELS:
+                errors.append(f"Invalid waveform label: must be one of {_VALID_WAVEFORM_LABELS}")
             
             if "peakToPeak" in processed:
                 if not isinstance(processed["peakToPeak"], (int, float)):
@@ -367,6 +385,15 @@ def validate_waveform(waveform: Dict[str, Any], waveform_type: str = "current")
     return errors
 
 
+# Dispatch table shared by quick_validate and print_validation_report
+_VALIDATORS = {
+    "inputs": validate_inputs,
+    "magnetic": validate_magnetic,
+    "core": validate_core,
+    "operating_point": validate_operating_point,
+}
+
+
 def quick_validate(data: Dict[str, Any], data_type: str = "auto") -> bool:
     """
     Quick validation check - returns True if valid, False otherwise.
@@ -395,14 +422,7 @@ def quick_validate(data: Dict[str, Any], data_type: str = "auto") -> bool:
         else:
             return True  # Can't detect type, assume valid
     
-    validators = {
-        "inputs": validate_inputs,
-        "magnetic": validate_magnetic,
-        "core": validate_core,
-        "operating_point": validate_operating_point,
-    }
-    
-    validator = validators.get(data_type)
+    validator = _VALIDATORS.get(data_type)
     if not validator:
         return True
     
@@ -422,14 +442,7 @@ def print_validation_report(data: Dict[str, Any], data_type: str = "inputs") ->
         >>> print_validation_report(inputs, "inputs")
         ✓ Validation passed for inputs
     """
-    validators = {
-        "inputs": validate_inputs,
-        "magnetic": validate_magnetic,
-        "core": validate_core,
-        "operating_point": validate_operating_point,
-    }
-    
-    validator = validators.get(data_type)
+    validator = _VALIDATORS.get(data_type)
     if not validator:
         print(f"Unknown data type: {data_type}")
         return
@@ -379,6 +379,30 @@ class TestValidationModule:
         
         errors = validate_core(invalid_core)
         assert len(errors) > 0  # Should have errors
+    
+    def test_validator_cache(self, tmp_path, monkeypatch):
+        """Test validators are reused and missing schemas are not cached."""
+        try:
+            from api import validation
+        except ImportError:
+            pytest.skip("Validation module not available")
+        if not validation.HAS_JSONSCHEMA:
+            pytest.skip("jsonschema not installed")
+        
+        monkeypatch.setattr(validation, "_VALIDATOR_CACHE", {})
+        
+        # No schemas available yet
+        monkeypatch.setattr(validation, "_get_schema_dir", lambda: None)
+        assert validation._get_validator("inputs") is None
+        assert validation.validate_inputs({}) == ["Could not find MAS schema files. Skipping validation."]
+        
+        # Schemas installed later in the same process must be picked up
+        (tmp_path / "inputs.json").write_text(json.dumps({"type": "object"}))
+        monkeypatch.setattr(validation, "_get_schema_dir", lambda: tmp_path)
+        validator = validation._get_validator("inputs")
+        assert validator is not None
+        assert validation._get_validator("inputs") is validator
+        assert validation.validate_inputs({}) == []
 
 
 class TestExampleScriptsImport: